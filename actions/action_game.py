@@ -10,11 +10,34 @@ Classes:
     Action (ABC): An abstract base class that provides a template for different types
                   of client actions, with abstract methods for constructing protocol
                   messages, handling server responses, and processing responses from the server.
+
+Functions:
+    filter_protocol_message(message, maxsplit) -> list:
+        Splits a protocol message into its colon-separated components.
 """
 
 from abc import ABC, abstractmethod
 
 
+def filter_protocol_message(message, maxsplit: int = -1) -> list:
+    """
+    Splits and filters the protocol message into parts based on the colon delimiter.
+
+    Args:
+        message (str): The protocol message string to be split.
+        maxsplit (int): Maximum number of splits to perform; -1 (the default) splits
+                        on every colon.
+
+    Returns:
+        list: A list of strings, split by the colon character, which represents
+              the components of the protocol message.
+
+    This function provides a utility to standardize the splitting of protocol
+    messages into components (e.g., action type, parameters) for easier processing.
+    """
+    return message.strip().split(':', maxsplit)
+
+
 class Action(ABC):
     """
     An abstract base class representing a generic action that can be taken by
@@ -23,6 +46,9 @@ class Action(ABC):
     messages, handles server responses, and processes responses from the server.
     """
 
+    # Declared empty so subclasses that define __slots__ get instances without a __dict__
+    __slots__ = ()
+
     @abstractmethod
     def construct_protocol_message(self) -> str:
         """
@@ -36,13 +62,14 @@ class Action(ABC):
         """
 
     @abstractmethod
-    def to_client_stdout(self, response: str, client) -> None:
+    def to_client_stdout(self, parts: list, client) -> None:
         """
         Processes a server response for this action and outputs relevant information
         to the client’s stdout or stderr.
 
         Args:
-            response (str): The server's response message for this action.
+            parts (list): The server's response message for this action, already split
+                          into its colon-separated components.
             client: The client instance, allowing this method to modify client state if needed.
 
         This method should be implemented by subclasses to define how responses
@@ -66,19 +93,5 @@ class Action(ABC):
         a response message to be sent back to the client.
         """
 
-    @staticmethod
-    def filter_protocol_message(message) -> list:
-        """
-        Splits and filters the protocol message into parts based on the colon delimiter.
-
-        Args:
-            message (str): The protocol message string to be split.
-
-        Returns:
-            list: A list of strings, split by the colon character, which represents
-                  the components of the protocol message.
-
-        This static method provides a utility to standardize the splitting of protocol
-        messages into components (e.g., action type, parameters) for easier processing.
-        """
-        return message.strip().split(':')
+    # Kept so existing `Action.filter_protocol_message(...)` callers continue to work
+    filter_protocol_message = staticmethod(filter_protocol_message)
@@ -9,6 +9,21 @@ server responses.
 import sys
 from actions.action_game import Action
 
+# Pre-encoded LOGIN responses, one per ACKSTATUS code
+_ACK_LOGIN_OK = b"LOGIN:ACKSTATUS:0\n"
+_ACK_LOGIN_NO_USER = b"LOGIN:ACKSTATUS:1\n"
+_ACK_LOGIN_WRONG_PASSWORD = b"LOGIN:ACKSTATUS:2\n"
+_ACK_LOGIN_BAD_FORMAT = b"LOGIN:ACKSTATUS:3\n"
+_ACK_LOGIN_IN_USE = b"LOGIN:ACKSTATUS:4\n"
+
+# Error printed by the client for each failing LOGIN ACKSTATUS code
+_LOGIN_ERRORS = {
+    "1": "Error: User not found\n",
+    "2": "Error: Wrong password\n",
+    "3": "Error: Invalid message format of LOGIN\n",
+    "4": "Error: The account has been logged in by another user\n",
+}
+
 
 class LoginAction(Action):
     """
@@ -17,6 +32,8 @@ class LoginAction(Action):
     credentials to the server.
     """
 
+    __slots__ = ("username", "password")
+
     def __init__(self):
         """
         Initializes a LoginAction instance with username and password attributes.
@@ -39,13 +56,13 @@ class LoginAction(Action):
         self.password = password
         return f"LOGIN:{username}:{password}"
 
-    def to_client_stdout(self, response: str, client) -> None:
+    def to_client_stdout(self, parts: list, client) -> None:
         """
         Processes the server's response to a LOGIN request and prints
         appropriate messages based on the ACKSTATUS code.
 
         Args:
-            response (str): The server's response message.
+            parts (list): The parsed parts of the server's response message.
             client: The client instance, used to set authentication status.
 
         ACKSTATUS Codes:
@@ -56,23 +73,16 @@ class LoginAction(Action):
             - "4": Account is already logged in from another client
         """
         try:
-            parts = Action.filter_protocol_message(response)
             if parts[1] == "ACKSTATUS":
                 ack_status = parts[2]
                 if ack_status == "0":
                     print(f"Welcome {self.username}")
                     client.name = self.username
                     client.is_authenticated = True
-                elif ack_status == "1":
-                    print("Error: User not found", file=sys.stderr)
-                elif ack_status == "2":
-                    print("Error: Wrong password", file=sys.stderr)
-                elif ack_status == "3":
-                    print("Error: Invalid message format of LOGIN", file=sys.stderr)
-                elif ack_status == "4":
-                    print("Error: The account has been logged in by another user", file=sys.stderr)
+                elif ack_status in _LOGIN_ERRORS:
+                    sys.stderr.write(_LOGIN_ERRORS[ack_status])
             else:
-                print(f"Error: {response}", file=sys.stderr)
+                print(f"Error: {':'.join(parts)}", file=sys.stderr)
         except ValueError as e:
             print(f"Error: {e}", file=sys.stderr)
 
@@ -94,16 +104,15 @@ class LoginAction(Action):
             - Sends "LOGIN:ACKSTATUS:2" if the password is incorrect.
         """
         if len(parts) != 3:
-            conn.sendall("LOGIN:ACKSTATUS:3\n".encode('ascii'))
+            server.outbox.send(conn, _ACK_LOGIN_BAD_FORMAT)
             return
         _, username, password = parts
         if not server.user_db.user_exists(username):
-            conn.sendall("LOGIN:ACKSTATUS:1\n".encode('ascii'))
+            server.outbox.send(conn, _ACK_LOGIN_NO_USER)
         elif server.user_db.authenticate_user(username, password):
-            if username in server.authenticated_users.values():
-                conn.sendall("LOGIN:ACKSTATUS:4\n".encode('ascii'))
+            if server.add_authenticated_user(conn, username):
+                server.outbox.send(conn, _ACK_LOGIN_OK)
             else:
-                server.authenticated_users[conn] = username
-                conn.sendall("LOGIN:ACKSTATUS:0\n".encode('ascii'))
+                server.outbox.send(conn, _ACK_LOGIN_IN_USE)
         else:
-            conn.sendall("LOGIN:ACKSTATUS:2\n".encode('ascii'))
+            server.outbox.send(conn, _ACK_LOGIN_WRONG_PASSWORD)
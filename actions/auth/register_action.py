@@ -8,6 +8,18 @@ for a username and password, constructing a protocol message, and processing ser
 import sys
 from actions.action_game import Action
 
+# Pre-encoded REGISTER responses, one per ACKSTATUS code
+_ACK_REGISTER_OK = b"REGISTER:ACKSTATUS:0\n"
+_ACK_REGISTER_EXISTS = b"REGISTER:ACKSTATUS:1\n"
+_ACK_REGISTER_BAD_FORMAT = b"REGISTER:ACKSTATUS:2\n"
+_ACK_REGISTER_TOO_LONG = b"REGISTER:ACKSTATUS:3\n"
+
+# Error printed by the client for each failing REGISTER ACKSTATUS code
+_REGISTER_ERRORS = {
+    "1": "Error: User already exists\n",
+    "2": "Error: Invalid message format of REGISTER\n",
+}
+
 
 class RegisterAction(Action):
     """
@@ -16,6 +28,8 @@ class RegisterAction(Action):
     to the server to create a new account.
     """
 
+    __slots__ = ("username", "password")
+
     def __init__(self):
         """
         Initializes a RegisterAction instance with username and password attributes.
@@ -49,13 +63,13 @@ class RegisterAction(Action):
             self.password = password
             return f"REGISTER:{username}:{password}"
 
-    def to_client_stdout(self, response: str, client) -> None:
+    def to_client_stdout(self, parts: list, client) -> None:
         """
         Processes the server's response to a REGISTER request and prints
         appropriate messages based on the ACKSTATUS code.
 
         Args:
-            response (str): The server's response message.
+            parts (list): The parsed parts of the server's response message.
             client: The client instance (not directly used in this method).
 
         ACKSTATUS Codes:
@@ -64,12 +78,13 @@ class RegisterAction(Action):
             - "2": Invalid REGISTER message format.
         """
         try:
-            if response == "REGISTER:ACKSTATUS:0":
+            if len(parts) != 3 or parts[1] != "ACKSTATUS":
+                return
+            ack_status = parts[2]
+            if ack_status == "0":
                 print(f"Successfully created user account {self.username}")
-            elif response == "REGISTER:ACKSTATUS:1":
-                print("Error: User already exists", file=sys.stderr)
-            elif response == "REGISTER:ACKSTATUS:2":
-                print("Error: Invalid message format of REGISTER", file=sys.stderr)
+            elif ack_status in _REGISTER_ERRORS:
+                sys.stderr.write(_REGISTER_ERRORS[ack_status])
         except ValueError as e:
             print(f"An error occurred: {e}", file=sys.stderr)
 
@@ -91,12 +106,12 @@ class RegisterAction(Action):
             - Sends "REGISTER:ACKSTATUS:0" if the registration is successful.
         """
         if len(parts) != 3:
-            conn.sendall("REGISTER:ACKSTATUS:2\n".encode('ascii'))
+            server.outbox.send(conn, _ACK_REGISTER_BAD_FORMAT)
             return
         _, username, password = parts
         if len(username) > 20 or len(password) > 20:
-            conn.sendall("REGISTER:ACKSTATUS:3\n".encode('ascii'))
+            server.outbox.send(conn, _ACK_REGISTER_TOO_LONG)
         elif server.user_db.register_user(username, password):
-            conn.sendall("REGISTER:ACKSTATUS:0\n".encode('ascii'))
+            server.outbox.send(conn, _ACK_REGISTER_OK)
         else:
-            conn.sendall("REGISTER:ACKSTATUS:1\n".encode('ascii'))
+            server.outbox.send(conn, _ACK_REGISTER_EXISTS)
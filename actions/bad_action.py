@@ -4,6 +4,9 @@ BadAction Module
 This module defines the BadAction class, which represents an invalid or unrecognized action.
 BadAction provides a default response for any actions that do not match valid types, returning
 a "BAD:ACTION" message to indicate an error.
+
+Attributes:
+    BAD_ACTION (BadAction): The shared BadAction instance returned for unrecognised actions.
 """
 
 from actions.action_game import Action
@@ -32,13 +35,13 @@ class BadAction(Action):
         """
         return "BAD:ACTION"
 
-    def to_client_stdout(self, response: str, client) -> None:
+    def to_client_stdout(self, parts: list, client) -> None:
         """
         Handles server responses for a BadAction. Since BadAction is not expected to
         produce any meaningful client output, this method is essentially a placeholder.
 
         Args:
-            response (str): The server's response message (not used in this case).
+            parts (list): The parsed server's response message (not used in this case).
             client: The client instance (not used in this case).
         """
 
@@ -53,3 +56,7 @@ class BadAction(Action):
             parts: The message object (not used in this case).
             server: The server instance (not used in this case).
         """
+
+
+# BadAction holds no state, so a single shared instance serves every unrecognised action
+BAD_ACTION = BadAction()
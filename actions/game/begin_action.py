@@ -6,6 +6,7 @@ a game match between two players. It constructs and handles protocol messages th
 indicate the start of a match and outputs the start message to the client.
 """
 
+import sys
 from actions.action_game import Action
 
 
@@ -23,6 +24,9 @@ class BeginAction(Action):
                           or server states for this action.
     """
 
+    # Message shown to the client; {0} is the player whose turn it is, {1} the opponent
+    MATCH_TEMPLATE = "Match between {0} and {1} will commence, it is currently {0}'s turn.\n"
+
     def construct_protocol_message(self) -> str:
         """
         Constructs the protocol message for beginning the game.
@@ -32,19 +36,15 @@ class BeginAction(Action):
         """
         return ""
 
-    def to_client_stdout(self, response: str, client) -> None:
+    def to_client_stdout(self, parts: list, client) -> None:
         """
         Outputs a message to the client indicating the start of the game match.
 
         Args:
-            response (str): The protocol response message containing player information.
+            parts (list): The parsed protocol response message containing player information.
             client (object): The client instance, though unused in this method.
         """
-        parts = Action.filter_protocol_message(response)
-        print(
-            f"Match between {parts[1]} and {parts[2]} will commence, "
-            f"it is currently {parts[1]}'s turn."
-        )
+        sys.stdout.write(self.MATCH_TEMPLATE.format(parts[1], parts[2]))
 
     def process_response(self, conn, parts, server):
         """
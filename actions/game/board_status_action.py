@@ -10,8 +10,25 @@ Classes:
                                 server-provided status.
 """
 
+import sys
 from actions.action_game import Action
 
+# Maps each board status digit to the marker displayed in that cell
+_BOARD_TABLE = str.maketrans({
+    '1': 'X',  # Player X marker
+    '2': 'O',  # Player O marker
+    '0': ' '  # Empty space
+})
+
+# The 3x3 grid, filled with the nine translated cells
+_BOARD_FRAME = (
+    " {} | {} | {}\n"
+    "---+---+---\n"
+    " {} | {} | {}\n"
+    "---+---+---\n"
+    " {} | {} | {}\n"
+)
+
 
 class BoardStatusAction(Action):
     """
@@ -37,49 +54,35 @@ class BoardStatusAction(Action):
         """
         return ""
 
-    def to_client_stdout(self, response: str, client) -> None:
+    def to_client_stdout(self, parts: list, client) -> None:
         """
         Outputs the current board status to the client's standard output.
 
         Args:
-            response (str): The protocol response message containing the board status as a
+            parts (list): The parsed protocol response message containing the board status as a
             9-character string.
             client (object): The client instance to track the current turn.
         """
         # Extract the board status from the response
-        status = Action.filter_protocol_message(response)[1]
-
-        # Define a mapping for each character in the status string
-        symbol_map = {
-            '1': 'X',  # Player X marker
-            '2': 'O',  # Player O marker
-            '0': ' '  # Empty space
-        }
+        status = parts[1]
 
         # Map each character in the status to its corresponding symbol
-        board = [symbol_map.get(char, ' ') for char in status]
-
-        # Format and print the board in a 3x3 grid
-        rows = [
-            board[0:3],  # First row
-            board[3:6],  # Second row
-            board[6:9]  # Third row
-        ]
-
-        # Display the formatted board
-        for i, row in enumerate(rows):
-            print(" " + " | ".join(row))
-            if i < 2:
-                print("---+---+---")
-
-        # Display turn information based on client's turn status
+        cells = status.translate(_BOARD_TABLE)
+
+        # Format the board in a 3x3 grid
+        frame = _BOARD_FRAME.format(*cells)
+
+        # Append turn information based on client's turn status
         if client.in_turn and (client.is_player or client.owner):
-            print("Your opponent's turn.")
+            frame += "Your opponent's turn.\n"
             client.in_turn = False
         elif not client.in_turn and (client.is_player or client.owner):
-            print("It's your turn.")
+            frame += "It's your turn.\n"
             client.in_turn = True
 
+        # Display the board and turn information in a single write
+        sys.stdout.write(frame)
+
     def process_response(self, conn, parts, server):
         """
         Processes the response from the server. This action does not modify
@@ -8,6 +8,13 @@ the game result to the client.
 
 from actions.action_game import Action
 
+# Message printed for each GAMEEND result code other than "0" (a win, which depends
+# on who is reading); "{0}" is replaced with the username sent by the server, if any
+_GAME_END_MESSAGES = {
+    "1": "The game ended in a draw.",
+    "2": "{0} won due to the opposing player forfeiting.",
+}
+
 
 class GameEndAction(Action):
     """
@@ -31,12 +38,12 @@ class GameEndAction(Action):
         """
         return ""
 
-    def to_client_stdout(self, response: str, client) -> None:
+    def to_client_stdout(self, parts: list, client) -> None:
         """
         Outputs the game result to the client's standard output based on the server response.
 
         Args:
-            response (str): The protocol response message containing game result information.
+            parts (list): The parsed protocol response message containing game result information.
             client (object): The client instance, used to determine if the client was a player.
 
         Game End Scenarios:
@@ -44,7 +51,6 @@ class GameEndAction(Action):
             - "1": The game ended in a draw.
             - "2": The specified player won due to the opponent forfeiting.
         """
-        parts = Action.filter_protocol_message(response)
         if parts[2] == "0":
             if parts[3] == client.name and (client.is_player or client.owner):
                 print("Congratulations, you won!")
@@ -52,10 +58,8 @@ class GameEndAction(Action):
                 print("Sorry, you lost. Good luck next time.")
             else:
                 print(f"{parts[3]} has won this game.")
-        elif parts[2] == "1":
-            print("The game ended in a draw.")
-        elif parts[2] == "2":
-            print(f"{parts[3]} won due to the opposing player forfeiting.")
+        elif parts[2] in _GAME_END_MESSAGES:
+            print(_GAME_END_MESSAGES[parts[2]].format(*parts[3:]))
         client.after_game()
 
     def process_response(self, conn, parts, server):
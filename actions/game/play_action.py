@@ -2,16 +2,14 @@
 PlayAction Module
 
 This module defines the PlayAction class and supporting functions to handle the process of
-a player making a move in a Tic-Tac-Toe game. It checks room membership, validates moves,
-updates game status, and manages the end-of-game responses.
+a player making a move in a Tic-Tac-Toe game. It validates moves, updates game status,
+and manages the end-of-game responses.
 
 Classes:
     PlayAction: Represents the action of a player placing a marker on the board.
 
 Functions:
-    check_join_room: Verifies if a player is in an active room.
-    check_all_characters_not_zero: Checks if all positions on the board are filled.
-    check_status: Determines if there is a winner based on the board status.
+    broadcast_to_room: Sends one encoded message to the players and viewers of a room.
     handle_response_game_end: Manages end-of-game responses, sending messages to players
                               and viewers, and cleaning up the room.
     play_game: Executes the player’s move, updates the board, and checks game state.
@@ -19,62 +17,27 @@ Functions:
 
 from actions.action_game import Action
 
+# Pre-encoded responses for a client that is not logged in or not in a room
+_BADAUTH = b"BADAUTH\n"
+_NOROOM = b"NOROOM\n"
 
-def check_join_room(conn, server):
-    """
-    Checks if the player associated with the connection is currently in a room.
-
-    Args:
-        conn: The connection object of the player.
-        server: The server instance with authenticated users and rooms.
-
-    Returns:
-        bool: True if the player is in a room, False otherwise.
-    """
-    if server.authenticated_users[conn] in server.rooms_dict:
-        return True
-    return False
+# Valid board coordinates: a single column or row index from 0 to 2
+_COORDINATE_CHOICES = ("0", "1", "2")
 
 
-def check_all_characters_not_zero(input_string):
+def broadcast_to_room(room, server, payload):
     """
-    Checks if all characters in a string are non-zero, indicating the board is full.
+    Sends one encoded message to both players and every viewer of a room.
 
     Args:
-        input_string (str): The string to check, typically representing the board status.
-
-    Returns:
-        bool: True if all characters are non-zero, False otherwise.
-    """
-    for char in input_string:
-        if char == '0':
-            return False
-    return True
-
-
-def check_status(board_status):
-    """
-    Determines if there is a winner based on the current board status.
-
-    Args:
-        board_status (str): A 9-character string representing the Tic-Tac-Toe board.
-
-    Returns:
-        str: "1" if player X wins, "2" if player O wins, or "0" if no winner.
+        room (Room): The game room instance.
+        server: The server instance whose outbox delivers the message.
+        payload (bytes): The encoded message, including its trailing newline.
     """
-    if board_status[0] == board_status[1] and board_status[1] == board_status[2]:
-        return board_status[0]
-    if board_status[0] == board_status[3] and board_status[3] == board_status[6]:
-        return board_status[0]
-    if board_status[0] == board_status[4] and board_status[4] == board_status[8]:
-        return board_status[0]
-    if board_status[1] == board_status[4] and board_status[4] == board_status[7]:
-        return board_status[1]
-    if board_status[2] == board_status[5] and board_status[5] == board_status[8]:
-        return board_status[2]
-    if board_status[2] == board_status[4] and board_status[4] == board_status[6]:
-        return board_status[2]
-    return "0"
+    send = server.outbox.send
+    for recipient in (room.x_player, room.y_player, *room.viewer):
+        if recipient is not None:
+            send(recipient, payload)
 
 
 def handle_response_game_end(room, server, message):
@@ -87,17 +50,8 @@ def handle_response_game_end(room, server, message):
         server: The server instance with room information.
         message (str): The message to send to clients indicating the game has ended.
     """
-    x_player_conn = room.x_player
-    y_player_conn = room.y_player
-    x_player_conn.sendall(f"{message}\n".encode('ascii'))
-    if y_player_conn is not None:
-        y_player_conn.sendall(f"{message}\n".encode('ascii'))
-    for viewer in room.viewer:
-        viewer.sendall(f"{message}\n".encode('ascii'))
-
-    owner = server.authenticated_users[x_player_conn]
-    del server.rooms_dict[owner]
-    del server.rooms[room.name]
+    broadcast_to_room(room, server, f"{message}\n".encode('ascii'))
+    server.remove_room(room)
 
 
 def play_game(conn, room, position):
@@ -107,31 +61,27 @@ def play_game(conn, room, position):
     Args:
         conn: The player connection making the move.
         room (Room): The game room instance.
-        position (int): The position index on the board to place the move.
+        position (int): The position index on the board to place the move; must be empty.
 
     Returns:
         str: Status message indicating game continuation or end.
     """
     x_player_conn = room.x_player
     y_player_conn = room.y_player
+    is_x = x_player_conn is conn
 
-    if room.board_status[position] != "0":
-        return ""
-
-    value = "1" if room.x_player == conn else "2"
-    string_list = list(room.board_status)
-    string_list[position] = value
-    room.board_status = "".join(string_list)
+    room.set_position(position, 1 if is_x else 2)
 
-    if check_all_characters_not_zero(room.board_status):
-        return "GAMEEND1"
-
-    game_check = check_status(room.board_status)
-    if game_check != "0":
+    winner, full = room.outcome()
+    if winner != "0":
         return "GAMEEND0"
-    elif room.started:
-        room.current_turn = x_player_conn if y_player_conn == conn else y_player_conn
-        room.opposing_turn = x_player_conn if x_player_conn == conn else y_player_conn
+    if full:
+        return "GAMEEND1"
+    if room.started:
+        if is_x:
+            room.current_turn, room.opposing_turn = y_player_conn, x_player_conn
+        else:
+            room.current_turn, room.opposing_turn = x_player_conn, y_player_conn
         return "PLAYGAME"
 
 
@@ -163,23 +113,23 @@ class PlayAction(Action):
         x_verified = False
         while True:
             if not x_verified:
-                x = int(input("Enter x position:"))
-                if x < 0 or x > 2:
+                x = input("Enter x position:").strip()
+                if x not in _COORDINATE_CHOICES:
                     print(f"Error: Column values must be an integer between 0 and 2")
                     continue
                 x_verified = True
-            y = int(input("Enter y position:"))
-            if y < 0 or y > 2:
+            y = input("Enter y position:").strip()
+            if y not in _COORDINATE_CHOICES:
                 print(f"Error: Row values must be an integer between 0 and 2")
                 continue
             return f"PLACE:{x}:{y}"
 
-    def to_client_stdout(self, response: str, client) -> None:
+    def to_client_stdout(self, parts: list, client) -> None:
         """
         Placeholder method; no specific client output handling for PlayAction.
 
         Args:
-            response (str): The server's response message.
+            parts (list): The parsed parts of the server's response message.
             client: The client instance.
         """
 
@@ -193,41 +143,42 @@ class PlayAction(Action):
             server: The server instance with room data.
             position (int): The board position to place the move.
         """
-        cur_queue = room.x_player_queue if conn == room.x_player else room.y_player_queue
-        if room.current_turn == conn:
-            if not room.started:
+        # Each applied move hands the turn over; keep going while the new current player
+        # already has a move queued from before the game started
+        while True:
+            cur_queue = room.x_player_queue if conn is room.x_player else room.y_player_queue
+            if room.current_turn is conn:
+                if not room.started:
+                    cur_queue.append(position)
+                    return
+                if len(cur_queue) > 0:
+                    position = cur_queue.popleft()
+                if position is None:
+                    return
+            else:
                 cur_queue.append(position)
                 return
-            if len(cur_queue) > 0:
-                position = cur_queue.pop(0)
-            if position is None:
-                return
-        else:
-            cur_queue.append(position)
-            return
 
-        if position is None:
-            return
-        match_status = play_game(conn, room, position)
-        if match_status == "GAMEEND0":
-            username = server.authenticated_users[conn]
-            message = f"GAMEEND:{room.board_status}:0:{username}"
-            handle_response_game_end(room, server, message)
-            return
-        elif match_status == "GAMEEND1":
-            message = f"GAMEEND:{room.board_status}:1"
-            handle_response_game_end(room, server, message)
-            return
-        else:
-            if room.started:
-                x_player_conn = room.x_player
-                y_player_conn = room.y_player
-                x_player_conn.sendall(f"BOARDSTATUS:{room.board_status}\n".encode('ascii'))
-                if y_player_conn is not None:
-                    y_player_conn.sendall(f"BOARDSTATUS:{room.board_status}\n".encode('ascii'))
-                for viewer in room.viewer:
-                    viewer.sendall(f"BOARDSTATUS:{room.board_status}\n".encode('ascii'))
-                self.handle_play_game(room, room.current_turn, server, None)
+            # A move onto an occupied position is ignored and the turn stays with the player
+            if room.get_position(position) != 0:
+                position = None
+                continue
+
+            match_status = play_game(conn, room, position)
+            if match_status == "GAMEEND0":
+                username = server.authenticated_users[conn]
+                message = f"GAMEEND:{room.board_status}:0:{username}"
+                handle_response_game_end(room, server, message)
+                return
+            elif match_status == "GAMEEND1":
+                message = f"GAMEEND:{room.board_status}:1"
+                handle_response_game_end(room, server, message)
+                return
+            if not room.started:
+                return
+            broadcast_to_room(room, server, room.board_status_message)
+            conn = room.current_turn
+            position = None
 
     def process_response(self, conn, parts, server):
         """
@@ -239,14 +190,19 @@ class PlayAction(Action):
             server: The server instance to manage game state.
         """
         if conn not in server.authenticated_users:
-            conn.sendall("BADAUTH\n".encode('ascii'))
+            server.outbox.send(conn, _BADAUTH)
             return
-        if not check_join_room(conn, server):
-            conn.sendall("NOROOM\n".encode('ascii'))
+        room_name = server.conn_to_room.get(conn)
+        if room_name is None:
+            server.outbox.send(conn, _NOROOM)
             return
-        room_name = server.rooms_dict[server.authenticated_users[conn]]
         room = server.rooms[room_name]
 
+        # Ignore malformed moves rather than letting them index outside the board
+        if len(parts) != 3 or not (parts[1] in _COORDINATE_CHOICES
+                                   and parts[2] in _COORDINATE_CHOICES):
+            return
+
         x = int(parts[1])
         y = int(parts[2])
         index = y * 3 + x
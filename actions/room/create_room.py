@@ -6,11 +6,22 @@ It constructs and handles protocol messages for creating a room, processes serve
 and displays appropriate messages to the client.
 """
 
+import string
 import sys
-import re
 from models.room import Room
 from actions.action_game import Action
 
+# Pre-encoded CREATE responses, one per ACKSTATUS code
+_BADAUTH = b"BADAUTH\n"
+_ACK_CREATE_OK = b"CREATE:ACKSTATUS:0\n"
+_ACK_CREATE_INVALID_NAME = b"CREATE:ACKSTATUS:1\n"
+_ACK_CREATE_EXISTS = b"CREATE:ACKSTATUS:2\n"
+_ACK_CREATE_ROOM_LIMIT = b"CREATE:ACKSTATUS:3\n"
+_ACK_CREATE_BAD_FORMAT = b"CREATE:ACKSTATUS:4\n"
+
+# Characters allowed in a room name: letters, digits, dash, underscore and space
+_ROOM_NAME_CHARS = frozenset(string.ascii_letters + string.digits + "-_ ")
+
 
 class CreateRoomAction(Action):
     """
@@ -36,13 +47,13 @@ class CreateRoomAction(Action):
         self.name = name
         return f"CREATE:{name}"
 
-    def to_client_stdout(self, response: str, client) -> None:
+    def to_client_stdout(self, parts: list, client) -> None:
         """
         Processes the server's response to a CREATE request and prints appropriate
         messages based on the ACKSTATUS code.
 
         Args:
-            response (str): The server's response message.
+            parts (list): The parsed parts of the server's response message.
             client: The client instance to update based on room creation success.
 
         ACKSTATUS Codes:
@@ -53,8 +64,7 @@ class CreateRoomAction(Action):
             - "4": Invalid CREATE message format.
         """
         try:
-            parts: list = Action.filter_protocol_message(response)
-            if response == "BADAUTH":
+            if parts[0] == "BADAUTH":
                 print("Error: You must be logged in to perform this action.", file=sys.stderr)
                 return
 
@@ -92,29 +102,30 @@ class CreateRoomAction(Action):
             server: The server instance containing room and user data.
         """
         if conn not in server.authenticated_users:
-            conn.sendall("BADAUTH\n".encode('ascii'))
+            server.outbox.send(conn, _BADAUTH)
             return
 
         if len(parts) != 2:
-            conn.sendall("CREATE:ACKSTATUS:4\n".encode('ascii'))  # Invalid message format
+            server.outbox.send(conn, _ACK_CREATE_BAD_FORMAT)  # Invalid message format
             return
 
         room_name = parts[1]
 
-        if not re.match(r'^[a-zA-Z0-9-_ ]+$', room_name) or len(room_name) > 20:
-            conn.sendall("CREATE:ACKSTATUS:1\n".encode('ascii'))  # Invalid room name
+        if not room_name or len(room_name) > 20 or not _ROOM_NAME_CHARS.issuperset(room_name):
+            server.outbox.send(conn, _ACK_CREATE_INVALID_NAME)  # Invalid room name
             return
 
         if room_name in server.rooms:
-            conn.sendall("CREATE:ACKSTATUS:2\n".encode('ascii'))  # Room already exists
+            server.outbox.send(conn, _ACK_CREATE_EXISTS)  # Room already exists
             return
 
         if len(server.rooms) >= 256:
-            conn.sendall("CREATE:ACKSTATUS:3\n".encode('ascii'))  # Max room limit reached
+            server.outbox.send(conn, _ACK_CREATE_ROOM_LIMIT)  # Max room limit reached
             return
 
         # Create the room and assign the client as the 'x' player
-        server.rooms[room_name] = Room(room_name)
-        server.rooms[room_name].assign_x_player(conn)
-        server.rooms_dict[server.authenticated_users[conn]] = room_name
-        conn.sendall("CREATE:ACKSTATUS:0\n".encode('ascii'))
+        room = Room(room_name)
+        room.assign_x_player(conn)
+        server.add_room(room)
+        server.conn_to_room[conn] = room_name
+        server.outbox.send(conn, _ACK_CREATE_OK)
@@ -8,7 +8,14 @@ a room, handles the server's response, and outputs the appropriate message to th
 
 import sys
 from actions.action_game import Action
-from actions.game.play_action import PlayAction
+from actions.game.play_action import PlayAction, broadcast_to_room
+
+# Pre-encoded JOIN responses, one per ACKSTATUS code
+_BADAUTH = b"BADAUTH\n"
+_ACK_JOIN_OK = b"JOIN:ACKSTATUS:0\n"
+_ACK_JOIN_NO_ROOM = b"JOIN:ACKSTATUS:1\n"
+_ACK_JOIN_FULL = b"JOIN:ACKSTATUS:2\n"
+_ACK_JOIN_BAD_FORMAT = b"JOIN:ACKSTATUS:3\n"
 
 
 class JoinAction(Action):
@@ -43,25 +50,28 @@ class JoinAction(Action):
         self.mode = mode
         return f"JOIN:{room_name}:{mode}"
 
-    def to_client_stdout(self, response: str, client) -> None:
+    def to_client_stdout(self, parts: list, client) -> None:
         """
         Handles the server's response to a join request, displaying success or error messages.
 
         Args:
-            response (str): The server's response to the join request.
+            parts (list): The parsed parts of the server's response to the join request.
             client (object): The client instance to update based on join success.
         """
         try:
-            if response == "JOIN:ACKSTATUS:0":
+            if len(parts) != 3 or parts[1] != "ACKSTATUS":
+                return
+            ack_status = parts[2]
+            if ack_status == "0":
                 client.in_room = True
                 if self.mode == "PLAYER":
                     client.is_player = True
                 print(f"Successfully joined room {self.room_name} as a {self.mode}")
-            elif response == "JOIN:ACKSTATUS:1":
+            elif ack_status == "1":
                 print("Error: No room named {self.room_name}", file=sys.stderr)
-            elif response == "JOIN:ACKSTATUS:2":
+            elif ack_status == "2":
                 print("Error: The room {self.room_name} already has 2 players", file=sys.stderr)
-            elif response == "JOIN:ACKSTATUS:3":
+            elif ack_status == "3":
                 print("Error: Invalid message format of JOIN", file=sys.stderr)
         except ValueError as e:
             print(f"An error occurred: {e}", file=sys.stderr)
@@ -77,64 +87,58 @@ class JoinAction(Action):
             server: The server instance containing room and user data.
         """
         if conn not in server.authenticated_users:
-            conn.sendall("BADAUTH\n".encode('ascii'))
+            server.outbox.send(conn, _BADAUTH)
             return
 
         if len(parts) != 3:
-            conn.sendall("JOIN:ACKSTATUS:3\n".encode('ascii'))  # Invalid message format
+            server.outbox.send(conn, _ACK_JOIN_BAD_FORMAT)  # Invalid message format
             return
 
         _, room_name, mode = parts
 
         if mode not in ["PLAYER", "VIEWER"]:
-            conn.sendall("JOIN:ACKSTATUS:3\n".encode('ascii'))  # Invalid mode
+            server.outbox.send(conn, _ACK_JOIN_BAD_FORMAT)  # Invalid mode
             return
 
         if mode == "PLAYER":
             if room_name not in server.rooms:
-                conn.sendall("JOIN:ACKSTATUS:1\n".encode('ascii'))  # Room doesn't exist
+                server.outbox.send(conn, _ACK_JOIN_NO_ROOM)  # Room doesn't exist
                 return
-            if server.rooms[room_name].is_full():
-                conn.sendall("JOIN:ACKSTATUS:2\n".encode('ascii'))  # Room full
+            room = server.rooms[room_name]
+            if room.is_full():
+                server.outbox.send(conn, _ACK_JOIN_FULL)  # Room full
                 return
 
             # Assign player to the room and notify participants
-            server.rooms[room_name].assign_y_player(conn)
-            server.rooms_dict[server.authenticated_users[conn]] = room_name
-            conn.sendall("JOIN:ACKSTATUS:0\n".encode('ascii'))  # Success
+            room.assign_y_player(conn)
+            server.mark_room_full(room)
+            server.conn_to_room[conn] = room_name
+            server.outbox.send(conn, _ACK_JOIN_OK)  # Success
 
-            x_player_conn = server.rooms[room_name].x_player
-            y_player_conn = server.rooms[room_name].y_player
-            x_player = server.authenticated_users[x_player_conn]
-            y_player = server.authenticated_users[y_player_conn]
+            x_player = server.authenticated_users[room.x_player]
+            y_player = server.authenticated_users[room.y_player]
 
             # Notify all participants of the game start
-            server.rooms[room_name].started = True
-            begin_message = f"BEGIN:{x_player}:{y_player}\n".encode('ascii')
-            x_player_conn.sendall(begin_message)
-            y_player_conn.sendall(begin_message)
-            for viewer in server.rooms[room_name].viewer:
-                viewer.sendall(begin_message)
+            room.started = True
+            broadcast_to_room(room, server, f"BEGIN:{x_player}:{y_player}\n".encode('ascii'))
 
             # Start the game
-            room = server.rooms[room_name]
             play_action = PlayAction()
             play_action.handle_play_game(room, room.x_player, server, None)
 
         elif mode == "VIEWER":
             # If room exists, add the client as a viewer
-            if room_name in server.rooms:
-                server.rooms[room_name].add_viewer(conn)
-                conn.sendall("JOIN:ACKSTATUS:0\n".encode('ascii'))  # Success
-                current_player = server.authenticated_users[server.rooms[room_name].current_turn]
-
-                if server.rooms[room_name].opposing_turn is not None:
-                    connection = server.rooms[room_name].opposing_turn
-                    opposing_player = server.authenticated_users[connection]
-                    conn.sendall(f"INPROGRESS:{current_player}:{opposing_player}\n".encode('ascii'))
-
-                if server.rooms[room_name].board_status != "000000000":
-                    board_status = server.rooms[room_name].board_status
-                    conn.sendall(f"BOARDSTATUS:{board_status}\n".encode('ascii'))
+            room = server.rooms.get(room_name)
+            if room is not None:
+                room.add_viewer(conn)
+                server.outbox.send(conn, _ACK_JOIN_OK)  # Success
+                current_player = server.authenticated_users[room.current_turn]
+
+                if room.opposing_turn is not None:
+                    opposing_player = server.authenticated_users[room.opposing_turn]
+                    server.outbox.send(conn, f"INPROGRESS:{current_player}:{opposing_player}\n".encode('ascii'))
+
+                if room.board_status_int:
+                    server.outbox.send(conn, room.board_status_message)
             else:
-                conn.sendall("JOIN:ACKSTATUS:1\n".encode('ascii'))  # Room doesn't exist
+                server.outbox.send(conn, _ACK_JOIN_NO_ROOM)  # Room doesn't exist
@@ -7,9 +7,12 @@ either a player or a viewer.
 """
 
 import sys
-from models.room import Room
 from actions.action_game import Action
 
+# Pre-encoded ROOMLIST error responses; successful lists are built per request
+_BADAUTH = b"BADAUTH\n"
+_ACK_ROOMLIST_BAD_FORMAT = b"ROOMLIST:ACKSTATUS:1\n"
+
 
 class RoomListAction(Action):
     """
@@ -38,18 +41,17 @@ class RoomListAction(Action):
         self.mode = mode
         return f"ROOMLIST:{mode}"
 
-    def to_client_stdout(self, response: str, client) -> None:
+    def to_client_stdout(self, parts: list, client) -> None:
         """
         Handles the server's response to the room list request and displays the appropriate message
         or error to the client.
 
         Args:
-            response (str): The response message from the server.
+            parts (list): The parsed parts of the response message from the server.
             client: The client instance (unused in this method).
         """
         try:
-            parts: list = Action.filter_protocol_message(response)
-            if response == "BADAUTH":
+            if parts[0] == "BADAUTH":
                 print("Error: You must be logged in to perform this action", file=sys.stderr)
             elif parts[1] == "ACKSTATUS":
                 ack_status = parts[2]
@@ -73,19 +75,15 @@ class RoomListAction(Action):
             server: The server instance containing room and user data.
         """
         if conn not in server.authenticated_users:
-            conn.sendall("BADAUTH\n".encode('ascii'))
+            server.outbox.send(conn, _BADAUTH)
             return
 
         if len(parts) != 2:
-            conn.sendall("ROOMLIST:ACKSTATUS:1\n".encode('ascii'))
+            server.outbox.send(conn, _ACK_ROOMLIST_BAD_FORMAT)
             return
 
         _, mode = parts
-        if mode == "VIEWER":
-            room_names = ",".join(Room.get_viewable_room(server.rooms))
-            conn.sendall(f"ROOMLIST:ACKSTATUS:0:{room_names}\n".encode('ascii'))
-        elif mode == "PLAYER":
-            room_names = ",".join(sorted(Room.get_playable_room(server.rooms)))
-            conn.sendall(f"ROOMLIST:ACKSTATUS:0:{room_names}\n".encode('ascii'))
+        if mode == "VIEWER" or mode == "PLAYER":
+            server.outbox.send(conn, server.get_room_list(mode))
         else:
-            conn.sendall("ROOMLIST:ACKSTATUS:1\n".encode('ascii'))
+            server.outbox.send(conn, _ACK_ROOMLIST_BAD_FORMAT)
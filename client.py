@@ -16,7 +16,16 @@ Functions:
 import socket
 import sys
 import threading
+from actions.action_game import filter_protocol_message
 from creator.action_factory import action_factory, save_global_variable, get_global_variable
+from models.client_session import ClientSession
+
+# SO_RCVBUF/SO_SNDBUF size for the connection to the server
+SOCKET_BUFFER_SIZE = 64 * 1024
+
+# Size of the receive buffer reused for every read from the server; longer than any
+# server message (a ROOMLIST of 256 rooms is about 5.5 KB)
+RECV_BUFFER_SIZE = 16 * 1024
 
 
 class TicTacToeClient:
@@ -33,7 +42,8 @@ class TicTacToeClient:
         is_player (bool): Whether the client is a player (vs. viewer).
         owner (bool): Whether the client is the room owner.
         in_turn (bool): Whether it is the client's turn in the game.
-        disconnected (Event): Event to signal disconnection.
+        disconnected (bool): Whether the client has disconnected; only ever set to True.
+        session (ClientSession): Details remembered between a request and its response.
     """
     def __init__(self, host: str, port: int):
         """
@@ -47,12 +57,17 @@ class TicTacToeClient:
             Exception: If the client cannot connect to the server.
         """
         self.client = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        # Buffer sizes must be set before connect() to affect the TCP window scale
+        self.client.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SOCKET_BUFFER_SIZE)
+        self.client.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SOCKET_BUFFER_SIZE)
         try:
             self.client.connect((host, port))
         except (socket.error, ConnectionRefusedError) as exc:
             raise ConnectionRefusedError(
                 f"Error: cannot connect to server at {host} and {port}."
             ) from exc
+        # Moves are tiny, latency-sensitive messages; don't let Nagle hold them back
+        self.client.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
         self.name = None
         self.is_authenticated = False
         self.in_room = False
@@ -60,13 +75,14 @@ class TicTacToeClient:
         self.is_player = False
         self.owner = False
         self.in_turn = False
-        self.disconnected = threading.Event()
+        self.disconnected = False
+        self.session = ClientSession()
 
     def close(self):
         """
-        Closes the connection to the server and sets the disconnected event.
+        Closes the connection to the server and marks the client as disconnected.
         """
-        self.disconnected.set()
+        self.disconnected = True
         try:
             self.client.shutdown(socket.SHUT_RDWR)
         except OSError:
@@ -107,7 +123,7 @@ def main(args):
     thread_receive = threading.Thread(target=receive_messages, args=(client,))
     thread_receive.start()
 
-    while not client.disconnected.is_set():
+    while not client.disconnected:
         try:
             if client.can_quit:
                 client.close()
@@ -121,26 +137,17 @@ def main(args):
             client.close()
             break
 
-        if user_input.lower() == "quit":
+        if user_input == "QUIT":
             if not client.in_room or client.is_player:
                 client.close()
                 break
 
         action_game = action_factory(user_input)
+        # Each action prompts for and validates its own arguments (PLACE re-prompts until
+        # both coordinates are 0-2), so the message is ready to send as built
         message = action_game.construct_protocol_message()
-
-        if message.startswith("PLACE"):
-            try:
-                _, x, y = message.split(":")
-                if not (0 <= int(x) <= 2 and 0 <= int(y) <= 2):
-                    print("Position invalid")
-                    message = "ERROR"
-            except ValueError:
-                message = "ERROR"
-
-        if message != "ERROR":
-            save_global_variable(action_game)
-            client.client.sendall(message.encode('ascii'))
+        save_global_variable(action_game, client.session)
+        client.client.sendall(f"{message}\n".encode('ascii'))
 
     client.close()
     thread_receive.join()
@@ -154,23 +161,45 @@ def receive_messages(client_socket):
         client_socket (TicTacToeClient): The client instance.
     """
 
+    buffer = bytearray(RECV_BUFFER_SIZE)
+    view = memoryview(buffer)
+    # Bytes at the start of the buffer belonging to a message still being received
+    filled = 0
     try:
         while True:
-            response = client_socket.client.recv(8192).decode('utf-8').strip()
-            print(f"\033[92m{response}\033[0m")
-            if not response:
+            received = client_socket.client.recv_into(view[filled:])
+            if not received:
                 break
 
-            action_type = response.split(":")[0].strip()
-            action_game = action_factory(action_type)
-            get_global_variable(action_game)
-
-            if response.startswith("GAMEEND"):
-                if client_socket.in_room and not client_socket.is_player:
-                    client_socket.can_quit = True
-                    client_socket.close()
-                client_socket.in_room = False
-            action_game.to_client_stdout(response, client_socket)
+            # A single read may carry several newline-terminated messages, and the last
+            # one may be incomplete until the next read
+            end = filled + received
+            last_newline = buffer.rfind(b"\n", 0, end)
+            if last_newline == -1:
+                # A line that fills the whole buffer can't be a valid message; drop it
+                filled = end if end < RECV_BUFFER_SIZE else 0
+                continue
+            filled = end - last_newline - 1
+            lines = buffer[:last_newline].split(b"\n")
+            buffer[:filled] = buffer[last_newline + 1:end]
+            for line in lines:
+                # An invalid byte must not end the receive thread
+                response = line.decode('utf-8', 'replace').strip()
+                if not response:
+                    continue
+                print(f"\033[92m{response}\033[0m")
+
+                # Split each message once and hand the parts to its action
+                parts = filter_protocol_message(response, 3)
+                action_game = action_factory(parts[0])
+                get_global_variable(action_game, client_socket.session)
+
+                if parts[0] == "GAMEEND":
+                    if client_socket.in_room and not client_socket.is_player:
+                        client_socket.can_quit = True
+                        client_socket.close()
+                    client_socket.in_room = False
+                action_game.to_client_stdout(parts, client_socket)
 
     except Exception:
         pass
@@ -11,6 +11,11 @@ Classes:
 import json
 import os
 
+try:
+    import orjson
+except ImportError:  # orjson is an optional speed-up; the standard library parses the same files
+    orjson = None
+
 
 class ApplicationConfiguration:
     """
@@ -48,11 +53,12 @@ class ApplicationConfiguration:
         if not os.path.exists(path):
             raise FileNotFoundError(f"Error: {path} doesn't exist.")
 
-        with open(path, 'r', encoding='utf-8') as file:
-            try:
-                config = json.load(file)
-            except json.JSONDecodeError as exc:
-                raise ValueError(f"Error: {path} is not in a valid JSON format.") from exc
+        with open(path, 'rb') as file:
+            data = file.read()
+        try:
+            config = orjson.loads(data) if orjson else json.loads(data)
+        except json.JSONDecodeError as exc:
+            raise ValueError(f"Error: {path} is not in a valid JSON format.") from exc
 
         ApplicationConfiguration._validate_config(config, path)
         return config
@@ -68,7 +74,11 @@ class ApplicationConfiguration:
 
         Raises:
             KeyError: If required keys are missing.
-            ValueError: If the port number is out of range.
+            ValueError: If the port number is out of range, the optional socket buffer
+                        size is not a non-negative integer, the optional bcrypt
+                        cost factor is not an integer from 4 to 15, the optional
+                        client limit is not a positive integer, or the optional idle
+                        timeout is not a non-negative number.
         """
         required_keys = ['port', 'userDatabase']
         missing_keys = [key for key in required_keys if key not in config]
@@ -80,6 +90,25 @@ class ApplicationConfiguration:
         if not (isinstance(config['port'], int) and (1024 <= config['port'] <= 65535)):
             raise ValueError("Error: port number out of range")
 
+        socket_buffer = config.get('socketBuffer')
+        if socket_buffer is not None and not (
+                isinstance(socket_buffer, int) and socket_buffer >= 0):
+            raise ValueError("Error: socketBuffer must be a non-negative integer")
+
+        bcrypt_rounds = config.get('bcryptRounds')
+        if bcrypt_rounds is not None and not (
+                isinstance(bcrypt_rounds, int) and 4 <= bcrypt_rounds <= 15):
+            raise ValueError("Error: bcryptRounds must be an integer between 4 and 15")
+
+        max_clients = config.get('maxClients')
+        if max_clients is not None and not (isinstance(max_clients, int) and max_clients > 0):
+            raise ValueError("Error: maxClients must be a positive integer")
+
+        idle_seconds = config.get('idleSeconds')
+        if idle_seconds is not None and not (
+                isinstance(idle_seconds, (int, float)) and idle_seconds >= 0):
+            raise ValueError("Error: idleSeconds must be a non-negative number")
+
         if not os.path.isabs(config['userDatabase']):
             config['userDatabase'] = os.path.join(os.getcwd(), config['userDatabase'])
 
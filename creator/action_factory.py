@@ -6,25 +6,19 @@ actions in a game system. Each action corresponds to a specific user command, su
 as logging in, registering, joining a room, or making a move in the game. Actions
 are created using a factory pattern based on action type strings.
 
-Global Variables:
-    username (str): Stores the username of the currently authenticated user.
-    roomname (str): Stores the name of the room the user has joined or created.
-    roleroom (str): Stores the user's role in the room (e.g., "PLAYER" or "VIEWER").
-    mode (str): Stores additional mode information related to the room list.
-
 Functions:
     action_factory(action: str) -> Action:
         Creates and returns an instance of the appropriate Action subclass based on the action type.
 
-    save_global_variable(action_instance: Action) -> None:
-        Saves session-related data from the given action instance to global variables.
+    save_global_variable(action_instance: Action, session: ClientSession) -> None:
+        Saves session-related data from the given action instance to the client's session.
 
-    get_global_variable(action_instance: Action) -> None:
-        Retrieves session-related data from global variables
+    get_global_variable(action_instance: Action, session: ClientSession) -> None:
+        Retrieves session-related data from the client's session
         and assigns it to the given action instance.
 
 Imports:
-    Action, BadAction, BeginAction, BoardStatusAction, GameEndAction, InprogressAction,
+    Action, BAD_ACTION, BeginAction, BoardStatusAction, GameEndAction, InprogressAction,
     CreateRoomAction, JoinAction, LoginAction, RegisterAction,
     RoomListAction, PlayAction, QuitAction
 
@@ -33,7 +27,8 @@ actions, enabling continuity of user experience across interactions.
 """
 
 from actions.action_game import Action
-from actions.bad_action import BadAction
+from models.client_session import ClientSession
+from actions.bad_action import BAD_ACTION
 from actions.game.begin_action import BeginAction
 from actions.game.board_status_action import BoardStatusAction
 from actions.game.game_end_action import GameEndAction
@@ -46,8 +41,29 @@ from actions.room.room_list_action import RoomListAction
 from actions.game.play_action import PlayAction
 from actions.game.quit_action import QuitAction
 
-# Global variables to store session-related information
-username, roomname, roleroom, mode = None, None, None, None
+# Action class for each protocol command
+_ACTION_MAP = {
+    "LOGIN": LoginAction,
+    "REGISTER": RegisterAction,
+    "ROOMLIST": RoomListAction,
+    "CREATE": CreateRoomAction,
+    "JOIN": JoinAction,
+    "PLACE": PlayAction,
+    "FORFEIT": QuitAction,
+    "BEGIN": BeginAction,
+    "INPROGRESS": InprogressAction,
+    "BOARDSTATUS": BoardStatusAction,
+    "GAMEEND": GameEndAction
+}
+
+# Session data carried by each action type, as (ClientSession field, action attribute) pairs
+_SESSION_FIELDS = {
+    LoginAction: (("username", "username"),),
+    RegisterAction: (("username", "username"),),
+    CreateRoomAction: (("roomname", "name"),),
+    JoinAction: (("roomname", "room_name"), ("roleroom", "mode")),
+    RoomListAction: (("mode", "mode"),),
+}
 
 
 def action_factory(action: str) -> Action:
@@ -59,7 +75,7 @@ def action_factory(action: str) -> Action:
 
     Returns:
         Action: An instance of the corresponding action class (e.g., LoginAction, RegisterAction).
-                If the action type is unrecognized, it returns an instance of BadAction.
+                If the action type is unrecognized, it returns the shared BAD_ACTION instance.
 
     Action Mappings:
         - "LOGIN" -> LoginAction
@@ -74,30 +90,21 @@ def action_factory(action: str) -> Action:
         - "BOARDSTATUS" -> BoardStatusAction
         - "GAMEEND" -> GameEndAction
     """
-    action_map = {
-        "LOGIN": LoginAction,
-        "REGISTER": RegisterAction,
-        "ROOMLIST": RoomListAction,
-        "CREATE": CreateRoomAction,
-        "JOIN": JoinAction,
-        "PLACE": PlayAction,
-        "FORFEIT": QuitAction,
-        "BEGIN": BeginAction,
-        "INPROGRESS": InprogressAction,
-        "BOARDSTATUS": BoardStatusAction,
-        "GAMEEND": GameEndAction
-    }
-    return action_map.get(action, BadAction)()
-
-
-def save_global_variable(action_instance):
+    action_class = _ACTION_MAP.get(action)
+    if action_class is None:
+        return BAD_ACTION
+    return action_class()
+
+
+def save_global_variable(action_instance, session: ClientSession):
     """
-    Saves session-related data to global variables based on the type of action.
+    Saves session-related data to the client's session based on the type of action.
 
     Args:
         action_instance (Action): The action instance from which to retrieve and store data.
+        session (ClientSession): The session of the client sending the action.
 
-    This function updates global variables (`username`, `roomname`, `roleroom`, `mode`)
+    This function updates the session fields (`username`, `roomname`, `roleroom`, `mode`)
     based on the attributes of the action instance, allowing for persistence of session
     data across different actions.
 
@@ -108,30 +115,20 @@ def save_global_variable(action_instance):
         - JoinAction -> `roomname`, `roleroom`
         - RoomListAction -> `mode`
     """
-    global username, roomname, roleroom, mode
-
-    if isinstance(action_instance, LoginAction):
-        username = action_instance.username
-    elif isinstance(action_instance, RegisterAction):
-        username = action_instance.username
-    elif isinstance(action_instance, CreateRoomAction):
-        roomname = action_instance.name
-    elif isinstance(action_instance, JoinAction):
-        roomname = action_instance.room_name
-        roleroom = action_instance.mode
-    elif isinstance(action_instance, RoomListAction):
-        mode = action_instance.mode
-
-
-def get_global_variable(action_instance):
+    for field, attribute in _SESSION_FIELDS.get(type(action_instance), ()):
+        setattr(session, field, getattr(action_instance, attribute))
+
+
+def get_global_variable(action_instance, session: ClientSession):
     """
-    Retrieves and assigns session-related data from global variables to an action instance.
+    Retrieves and assigns session-related data from the client's session to an action instance.
 
     Args:
         action_instance (Action): The action instance to which session data should be assigned.
+        session (ClientSession): The session of the client receiving the response.
 
     This function updates the attributes of the action instance (`action_instance`) with
-    data stored in global variables, allowing continuity of user state across different actions.
+    data stored in the session, allowing continuity of user state across different actions.
 
     Data Mappings:
         - LoginAction -> `username`
@@ -140,14 +137,5 @@ def get_global_variable(action_instance):
         - JoinAction -> `roomname`, `roleroom`
         - RoomListAction -> `mode`
     """
-    if isinstance(action_instance, LoginAction):
-        action_instance.username = username
-    elif isinstance(action_instance, RegisterAction):
-        action_instance.username = username
-    elif isinstance(action_instance, CreateRoomAction):
-        action_instance.name = roomname
-    elif isinstance(action_instance, JoinAction):
-        action_instance.room_name = roomname
-        action_instance.mode = roleroom
-    elif isinstance(action_instance, RoomListAction):
-        action_instance.mode = mode
+    for field, attribute in _SESSION_FIELDS.get(type(action_instance), ()):
+        setattr(action_instance, attribute, getattr(session, field))
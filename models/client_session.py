@@ -0,0 +1,30 @@
+"""
+Client Session Model Module
+
+This module defines the ClientSession class, which holds the details a client remembers
+between the request it sends and the server's response to it.
+
+Classes:
+    ClientSession: Per-client session data carried across actions.
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(slots=True)
+class ClientSession:
+    """
+    Session data for a single client, saved from each outgoing action and restored into
+    the action that handles the matching server response.
+
+    Attributes:
+        username (Optional[str]): The username of the currently authenticated user.
+        roomname (Optional[str]): The name of the room the user has joined or created.
+        roleroom (Optional[str]): The user's role in the room ("PLAYER" or "VIEWER").
+        mode (Optional[str]): The mode requested in the last room list.
+    """
+    username: Optional[str] = None
+    roomname: Optional[str] = None
+    roleroom: Optional[str] = None
+    mode: Optional[str] = None
@@ -8,6 +8,56 @@ Classes:
     Room: Manages the state of a Tic-Tac-Toe room, including players, viewers, and game status.
 """
 
+from collections import deque
+from itertools import product
+
+# Board indices of every row, column and diagonal
+WINNING_LINES = (
+    (0, 1, 2), (3, 4, 5), (6, 7, 8),
+    (0, 3, 6), (1, 4, 7), (2, 5, 8),
+    (0, 4, 8), (2, 4, 6),
+)
+
+# The low bit of every position; a position is taken when either of its bits is set
+_ALL_POSITIONS = sum(0b01 << (2 * i) for i in range(9))
+
+# For each line, the low bit of each of its three positions
+_LINE_MASKS = tuple(sum(0b01 << (2 * i) for i in line) for line in WINNING_LINES)
+
+
+def _board_outcome(board):
+    """
+    Computes the winner and fullness of a packed board. The board is first split into
+    the positions held by X (low bit of a lane) and by O (high bit of a lane), so each
+    line is then a single mask-and-compare per player.
+
+    Args:
+        board (int): The board packed two bits per position, as in `Room.board_status_int`.
+
+    Returns:
+        tuple: ("1" if player X wins, "2" if player O wins, or "0" if no winner,
+                True if every position is taken).
+    """
+    x_positions = board & _ALL_POSITIONS
+    o_positions = (board >> 1) & _ALL_POSITIONS
+    full = (x_positions | o_positions) == _ALL_POSITIONS
+    for mask in _LINE_MASKS:
+        if x_positions & mask == mask:
+            return "1", full
+        if o_positions & mask == mask:
+            return "2", full
+    return "0", full
+
+
+# Outcome of every possible board (3^9 states), so evaluating a move is one dict lookup
+_OUTCOME_TABLE = {
+    board: _board_outcome(board)
+    for board in (
+        sum(value << (2 * i) for i, value in enumerate(values))
+        for values in product((0, 1, 2), repeat=9)
+    )
+}
+
 
 class Room:
     """
@@ -22,9 +72,13 @@ class Room:
         started (bool): Indicates whether the game has started.
         current_turn: The player whose turn it currently is.
         opposing_turn: The opposing player.
-        board_status (str): The current state of the board, represented as a 9-character string.
-        x_player_queue (list): Queue for 'X' player actions.
-        y_player_queue (list): Queue for 'O' player actions.
+        board_status_int (int): The current state of the board, packed two bits per position
+                                (position i in bits 2i and 2i+1): 0 empty, 1 'X', 2 'O'.
+        board_status (str): The board rendered as a 9-character string of "0", "1" and "2",
+                            as sent in BOARDSTATUS and GAMEEND messages.
+        board_status_message (bytes): The encoded BOARDSTATUS message for the current board.
+        x_player_queue (deque): Queue for 'X' player actions.
+        y_player_queue (deque): Queue for 'O' player actions.
     """
 
     def __init__(self, name: str):
@@ -41,9 +95,80 @@ class Room:
         self.started = False
         self.current_turn = None
         self.opposing_turn = None
-        self.board_status = "000000000"
-        self.x_player_queue = []
-        self.y_player_queue = []
+        self.board_status_int = 0
+        self._rendered_board_int = 0
+        self._rendered_board = "000000000"
+        self._board_status_message = b"BOARDSTATUS:000000000\n"
+        self.x_player_queue = deque()
+        self.y_player_queue = deque()
+
+    def _render_board(self):
+        """
+        Rebuilds the cached board string and BOARDSTATUS message if the board has changed
+        since they were last rendered.
+        """
+        board = self.board_status_int
+        if self._rendered_board_int != board:
+            self._rendered_board = "".join(str((board >> (2 * i)) & 0b11) for i in range(9))
+            self._board_status_message = f"BOARDSTATUS:{self._rendered_board}\n".encode('ascii')
+            self._rendered_board_int = board
+
+    @property
+    def board_status(self) -> str:
+        """
+        Renders the packed board as a 9-character string. The rendering is cached and
+        only rebuilt after the board changes.
+
+        Returns:
+            str: The board status, one digit per position.
+        """
+        self._render_board()
+        return self._rendered_board
+
+    @property
+    def board_status_message(self) -> bytes:
+        """
+        Returns the encoded BOARDSTATUS message for the current board, cached like
+        `board_status`.
+
+        Returns:
+            bytes: The newline-terminated "BOARDSTATUS:<board>" message.
+        """
+        self._render_board()
+        return self._board_status_message
+
+    def get_position(self, position: int) -> int:
+        """
+        Returns the marker at a board position.
+
+        Args:
+            position (int): The board position index (0-8).
+
+        Returns:
+            int: 0 if the position is empty, 1 for 'X', 2 for 'O'.
+        """
+        return (self.board_status_int >> (2 * position)) & 0b11
+
+    def set_position(self, position: int, value: int):
+        """
+        Places a marker at a board position.
+
+        Args:
+            position (int): The board position index (0-8).
+            value (int): 1 for 'X', 2 for 'O'.
+        """
+        shift = 2 * position
+        self.board_status_int = (self.board_status_int & ~(0b11 << shift)) | (value << shift)
+
+    def outcome(self) -> tuple:
+        """
+        Looks up the winner and fullness of the current board.
+
+        Returns:
+            tuple: ("1" if player X has won, "2" if player O has won, or "0" if nobody has,
+                    True if every position is taken).
+        """
+        return _OUTCOME_TABLE[self.board_status_int]
 
     def is_full(self) -> bool:
         """
@@ -94,17 +219,17 @@ class Room:
         Returns:
             list: Sorted list of room names.
         """
-        return sorted(list(rooms.keys()))
+        return sorted(rooms)
 
     @staticmethod
-    def get_playable_room(rooms: dict) -> list:
+    def get_playable_room(non_full_rooms: set) -> list:
         """
-        Returns a list of room names where players can join as players.
+        Returns a sorted list of room names where players can join as players.
 
         Args:
-            rooms (dict): Dictionary of room instances.
+            non_full_rooms (set): Names of the rooms with an available player slot.
 
         Returns:
-            list: List of room names with available player slots.
+            list: Sorted list of room names with available player slots.
         """
-        return [room for room in rooms.keys() if not rooms[room].is_full()]
+        return sorted(non_full_rooms)
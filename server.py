@@ -14,15 +14,88 @@ Functions:
 """
 
 import socket
+import struct
 import sys
 import threading
-from typing import Dict
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Optional
 
 from models.room import Room
 from creator.action_factory import action_factory
 from config.application_config import ApplicationConfiguration
-from service.database_service import UserDatabaseService
-from actions.game.quit_action import QuitAction
+from service.database_service import UserDatabaseService, DEFAULT_BCRYPT_ROUNDS
+from service.outbox_service import OutboxService
+from actions.bad_action import BAD_ACTION
+
+# Stack size for client handler threads; handlers never recurse deeply, so the
+# platform default (typically 8 MiB) only inflates per-connection memory
+HANDLER_STACK_SIZE = 512 * 1024
+
+# Default SO_RCVBUF/SO_SNDBUF size for client connections, overridable with the
+# "socketBuffer" configuration key (0 leaves the kernel's autotuning in place)
+DEFAULT_SOCKET_BUFFER = 64 * 1024
+
+# Default number of clients served at once, overridable with the "maxClients" configuration
+# key; connections beyond it are closed straight after being accepted
+DEFAULT_MAX_CLIENTS = 256
+
+# Default seconds a client may stay silent before it is disconnected if it has not logged
+# in, overridable with the "idleSeconds" configuration key (0 disables the timeout)
+DEFAULT_IDLE_SECONDS = 300
+
+# Size of each connection's receive buffer, reused for every read
+RECV_BUFFER_SIZE = 16 * 1024
+
+# Longest message a well-behaved client sends ("REGISTER:" plus a 20-character username
+# and password), with headroom; anything longer is rejected without being parsed
+MAX_MESSAGE_LENGTH = 64
+
+# Format-error response sent for an oversized message, by command; oversized messages
+# with any other command get no reply, as with unrecognised actions
+OVERSIZED_MESSAGE_REPLIES = {
+    "LOGIN": b"LOGIN:ACKSTATUS:3\n",
+    "REGISTER": b"REGISTER:ACKSTATUS:2\n",
+    "CREATE": b"CREATE:ACKSTATUS:4\n",
+    "JOIN": b"JOIN:ACKSTATUS:3\n",
+    "ROOMLIST": b"ROOMLIST:ACKSTATUS:1\n",
+}
+
+# No client message has more than three fields, so splitting stops after the third colon
+MAX_MESSAGE_SPLIT = 3
+
+# Commands a client may send to the server; anything else is handled as a bad action
+CLIENT_COMMANDS = ("LOGIN", "REGISTER", "ROOMLIST", "CREATE", "JOIN", "PLACE", "FORFEIT")
+
+
+def _receive_timeout(seconds) -> bytes:
+    """
+    Encodes a timeout for the SO_RCVTIMEO socket option. Unlike socket.settimeout, the
+    option only limits reads, so the outbox's non-blocking sends are left untouched.
+
+    Args:
+        seconds (int | float): The timeout in seconds.
+
+    Returns:
+        bytes: The option value in the platform's format.
+    """
+    if sys.platform == "win32":
+        return struct.pack("L", int(seconds * 1000))
+    return struct.pack("ll", int(seconds), int(seconds % 1 * 1_000_000))
+
+
+def _report_handler_error(future) -> None:
+    """
+    Prints the traceback of a client handler that ended with an exception, which the
+    thread pool would otherwise keep silently on the future.
+
+    Args:
+        future (Future): The finished handler's future.
+    """
+    exc = future.exception()
+    if exc is not None:
+        print("Client handler failed:")
+        traceback.print_exception(exc)
 
 
 class TicTacToeServer:
@@ -31,14 +104,25 @@ class TicTacToeServer:
     and handles the game logic for Tic-Tac-Toe.
 
     Attributes:
-        connectors (list): A list of active client connections.
+        connectors (set): The currently connected client sockets.
+        max_clients (int): Most clients connected at once; further connections are closed.
+        _pool (ThreadPoolExecutor): Runs the handler of each connection.
+        _idle_timeout (Optional[bytes]): SO_RCVTIMEO value applied to each connection,
+                                         or None if idle clients are never disconnected.
         server (socket): The main server socket for accepting new connections.
         user_db (UserDatabaseService): Service for managing user authentication.
+        outbox (OutboxService): Service through which every message to a client is sent.
         rooms (Dict[str, Room]): A dictionary of active game rooms.
         authenticated_users (dict): A dictionary mapping connections to authenticated usernames.
-        rooms_dict (Dict[str, str]): A dictionary mapping usernames to room names.
+        authenticated_usernames (set): The usernames in `authenticated_users`, for O(1)
+                                       "already logged in" checks.
+        conn_to_room (dict): A dictionary mapping each playing connection to its room name.
+        non_full_rooms (set): Names of the rooms still waiting for a second player.
+        _room_lists (Optional[Dict[str, bytes]]): Encoded ROOMLIST responses per mode, rebuilt
+                                                  on the first request after rooms change.
+        handlers (Dict[str, Callable]): Maps each client command to the `process_response`
+                                        method of a shared action instance.
     """
-    connectors = []
 
     def __init__(self, config_file_path: str):
         """
@@ -51,6 +135,13 @@ class TicTacToeServer:
         try:
             config = ApplicationConfiguration(config_file_path)
             port = config.get('port')
+            socket_buffer = config.get('socketBuffer')
+            if socket_buffer is None:
+                socket_buffer = DEFAULT_SOCKET_BUFFER
+            max_clients = config.get('maxClients') or DEFAULT_MAX_CLIENTS
+            idle_seconds = config.get('idleSeconds')
+            if idle_seconds is None:
+                idle_seconds = DEFAULT_IDLE_SECONDS
         except FileNotFoundError as e:
             print(e)
             sys.exit(1)
@@ -62,40 +153,112 @@ class TicTacToeServer:
         try:
             self.server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             self.server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            # Set before listen() so accepted connections inherit the sizes and the
+            # TCP window scale is negotiated for them
+            if socket_buffer:
+                self.server.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, socket_buffer)
+                self.server.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, socket_buffer)
             self.server.bind(('localhost', port))
             self.server.listen()
         except socket.error as e:
             print(f"Socket error: {e}")
             sys.exit(1)
 
-        # Initialize the user database service and game rooms
-        self.user_db = UserDatabaseService(config.get('userDatabase'))
+        self.connectors: set = set()
+        self._connectors_lock = threading.Lock()
+        self.max_clients = max_clients
+        self._pool = ThreadPoolExecutor(max_workers=max_clients)
+        self._idle_timeout = _receive_timeout(idle_seconds) if idle_seconds else None
+
+        # Initialize the user database service, outgoing message queues and game rooms
+        bcrypt_rounds = config.get('bcryptRounds')
+        if bcrypt_rounds is None:
+            bcrypt_rounds = DEFAULT_BCRYPT_ROUNDS
+        self.user_db = UserDatabaseService(config.get('userDatabase'), bcrypt_rounds)
+        self.outbox = OutboxService()
         self.rooms: Dict[str, Room] = {}
         self.authenticated_users: dict = {}
-        self.rooms_dict: Dict[str, str] = {}
+        self.authenticated_usernames: set = set()
+        self._auth_lock = threading.Lock()
+        self.conn_to_room: dict = {}
+        self.non_full_rooms: set = set()
+        self._room_lists: Optional[Dict[str, bytes]] = None
+        # Guards changes to rooms and non_full_rooms, and the ROOMLIST cache built from them
+        self._room_list_lock = threading.Lock()
+
+        # Server-side action handling is stateless, so each command gets one shared instance
+        self.handlers: Dict[str, Callable] = {
+            command: action_factory(command).process_response for command in CLIENT_COMMANDS
+        }
 
     def handle_client(self, conn):
         """
-        Handles incoming messages from a client connection.
+        Handles incoming messages from a client connection. Messages are newline-terminated;
+        a read may carry several messages or only part of one, so bytes are buffered until
+        a full line has arrived. The client is always disconnected and its socket closed
+        when this returns, including when it raises.
 
         Args:
             conn (socket): The client connection socket.
         """
+        buffer = bytearray(RECV_BUFFER_SIZE)
+        view = memoryview(buffer)
+        # Bytes at the start of the buffer belonging to a message still being received
+        filled = 0
+        # Set while the remainder of an oversized line is being thrown away
+        discarding = False
         connected = True
-        while connected:
-            try:
-                message = conn.recv(8192).decode('ascii')
-                if message:
-                    print(f"\033[92m{message}\033[0m")
-                    self.process_message(conn, message)
-                else:
-                    self.process_disconnect(conn)
+        try:
+            while connected:
+                try:
+                    received = conn.recv_into(view[filled:])
+                    if received:
+                        end = filled + received
+                        start = 0
+                        newline = buffer.find(b"\n", 0, end)
+                        while newline != -1:
+                            if discarding:
+                                discarding = False
+                            else:
+                                line = buffer[start:newline]
+                                # Every protocol field is ASCII; any other byte makes the
+                                # line malformed, and it is ignored like an unknown action
+                                if line.isascii():
+                                    message = line.decode('ascii')
+                                    print(f"\033[92m{message}\033[0m")
+                                    self.process_message(conn, message)
+                            start = newline + 1
+                            newline = buffer.find(b"\n", start, end)
+                        filled = end - start
+                        if filled > MAX_MESSAGE_LENGTH:
+                            # Too long to be valid; reject it now and drop the rest of the
+                            # line as it arrives instead of buffering without bound
+                            command = buffer[start:end].split(b":", 1)[0].strip()
+                            self.reject_oversized_message(conn, command.decode('ascii', 'replace'))
+                            filled = 0
+                            discarding = True
+                        elif start:
+                            buffer[:filled] = buffer[start:end]
+                    else:
+                        connected = False
+                except (BlockingIOError, TimeoutError):
+                    # The idle timeout expired; only clients that never logged in are dropped,
+                    # since players waiting for an opponent or a move are legitimately quiet
+                    if conn not in self.authenticated_users:
+                        connected = False
+                except ConnectionResetError:
+                    print("Client disconnected unexpectedly.")
                     connected = False
-            except ConnectionResetError:
-                print("Client disconnected unexpectedly.")
+        finally:
+            # Runs even if handling a message raised, so the user is never left logged in
+            # or in a room by a connection that is gone
+            try:
                 self.process_disconnect(conn)
-                connected = False
-        conn.close()
+            finally:
+                with self._connectors_lock:
+                    self.connectors.discard(conn)
+                self.outbox.discard(conn)
+                conn.close()
 
     def process_disconnect(self, conn):
         """
@@ -105,36 +268,155 @@ class TicTacToeServer:
         Args:
             conn (socket): The client connection socket.
         """
-        if QuitAction.check_join_room(conn, self):
-            action = QuitAction()
-            action.process_response(conn, None, self)
-        self.authenticated_users.pop(conn, None)
+        try:
+            if conn in self.conn_to_room:
+                self.handlers["FORFEIT"](conn, None, self)
+        finally:
+            # Even if the forfeit fails, the user must be able to log in again
+            self.conn_to_room.pop(conn, None)
+            self.remove_authenticated_user(conn)
+
+    def add_authenticated_user(self, conn, username: str) -> bool:
+        """
+        Marks a connection as logged in as `username`, unless that username is already
+        logged in from another connection.
+
+        Args:
+            conn (socket): The client connection socket.
+            username (str): The username that has just been authenticated.
+
+        Returns:
+            bool: True if the connection was marked as logged in, False if the username
+                  is already in use.
+        """
+        with self._auth_lock:
+            if username in self.authenticated_usernames:
+                return False
+            self.authenticated_usernames.discard(self.authenticated_users.get(conn))
+            self.authenticated_users[conn] = username
+            self.authenticated_usernames.add(username)
+            return True
+
+    def remove_authenticated_user(self, conn):
+        """
+        Removes a connection from the authenticated users, if present.
+
+        Args:
+            conn (socket): The client connection socket.
+        """
+        with self._auth_lock:
+            username = self.authenticated_users.pop(conn, None)
+            self.authenticated_usernames.discard(username)
+
+    def add_room(self, room: Room):
+        """
+        Adds a newly created room, open for a second player to join.
+
+        Args:
+            room (Room): The room to add.
+        """
+        with self._room_list_lock:
+            self.rooms[room.name] = room
+            self.non_full_rooms.add(room.name)
+            self._room_lists = None
+
+    def mark_room_full(self, room: Room):
+        """
+        Records that a room has its second player and can no longer be joined as a player.
+
+        Args:
+            room (Room): The room that has become full.
+        """
+        with self._room_list_lock:
+            self.non_full_rooms.discard(room.name)
+            self._room_lists = None
+
+    def remove_room(self, room: Room):
+        """
+        Removes a finished room, releasing both of its players from it.
+
+        Args:
+            room (Room): The room to remove.
+        """
+        self.conn_to_room.pop(room.x_player, None)
+        self.conn_to_room.pop(room.y_player, None)
+        with self._room_list_lock:
+            self.rooms.pop(room.name, None)
+            self.non_full_rooms.discard(room.name)
+            self._room_lists = None
+
+    def get_room_list(self, mode: str) -> bytes:
+        """
+        Returns the encoded ROOMLIST response for a mode, rebuilding the cached responses
+        if rooms have changed since they were last built.
+
+        Args:
+            mode (str): "PLAYER" or "VIEWER".
+
+        Returns:
+            bytes: The full "ROOMLIST:ACKSTATUS:0:<rooms>" response, newline-terminated.
+        """
+        with self._room_list_lock:
+            if self._room_lists is None:
+                viewable = ",".join(Room.get_viewable_room(self.rooms))
+                playable = ",".join(Room.get_playable_room(self.non_full_rooms))
+                self._room_lists = {
+                    "VIEWER": f"ROOMLIST:ACKSTATUS:0:{viewable}\n".encode('ascii'),
+                    "PLAYER": f"ROOMLIST:ACKSTATUS:0:{playable}\n".encode('ascii'),
+                }
+            return self._room_lists[mode]
 
     def process_message(self, conn, message):
         """
-        Processes a message received from a client by creating the appropriate action
-        and invoking its response handling.
+        Processes a message received from a client by looking up the handler for its
+        command and invoking it.
 
         Args:
             conn (socket): The client connection socket.
             message (str): The message received from the client.
         """
-        parts = message.strip().split(':')
-        command = parts[0]
-        action = action_factory(command)
-        action.process_response(conn, parts, self)
+        message = message.strip()
+        if len(message) > MAX_MESSAGE_LENGTH:
+            self.reject_oversized_message(conn, message.partition(':')[0])
+            return
+        parts = message.split(':', MAX_MESSAGE_SPLIT)
+        handler = self.handlers.get(parts[0], BAD_ACTION.process_response)
+        handler(conn, parts, self)
+
+    def reject_oversized_message(self, conn, command: str):
+        """
+        Answers a message longer than MAX_MESSAGE_LENGTH with its command's format-error
+        response, so the client is not left waiting for a reply.
+
+        Args:
+            conn (socket): The client connection socket.
+            command (str): The command the oversized message starts with.
+        """
+        reply = OVERSIZED_MESSAGE_REPLIES.get(command)
+        if reply is not None:
+            self.outbox.send(conn, reply)
 
     def start(self):
         """
-        Starts the server, continuously accepting new connections and spawning threads
-        to handle each client connection.
+        Starts the server, continuously accepting new connections and handing each one
+        to the handler thread pool.
         """
         print("Server started and listening for connections...")
+        threading.stack_size(HANDLER_STACK_SIZE)
         while True:
             conn, _ = self.server.accept()
-            self.connectors.append(conn)
-            client_thread = threading.Thread(target=self.handle_client, args=(conn,))
-            client_thread.start()
+            # Replies are small and latency-sensitive; don't let Nagle hold them back
+            conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            if self._idle_timeout:
+                conn.setsockopt(socket.SOL_SOCKET, socket.SO_RCVTIMEO, self._idle_timeout)
+            with self._connectors_lock:
+                # Every pool thread is taken; refuse rather than park the client unserved
+                if len(self.connectors) >= self.max_clients:
+                    conn.close()
+                    print("Connection refused: too many clients.")
+                    continue
+                self.connectors.add(conn)
+            self._pool.submit(self.handle_client, conn).add_done_callback(_report_handler_error)
 
 
 def main(config_file: str):
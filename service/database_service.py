@@ -10,8 +10,24 @@ Classes:
 
 import os
 import json
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Dict
 import bcrypt
 
+try:
+    import orjson
+except ImportError:  # orjson is an optional speed-up; the standard library parses the same files
+    orjson = None
+
+# bcrypt cost factor for new password hashes (the library's own default); each extra
+# round doubles the time to hash and to verify
+DEFAULT_BCRYPT_ROUNDS = 12
+
+# Maximum number of verified credentials kept in memory by authenticate_user
+AUTH_CACHE_SIZE = 1024
+
 
 class UserDatabaseService:
     """
@@ -20,24 +36,41 @@ class UserDatabaseService:
 
     Attributes:
         filename (str): Path to the JSON file storing user data.
+        rounds (int): bcrypt cost factor used when hashing new passwords.
+        _users (Dict[str, bytes]): Every user's bcrypt hash by username, loaded once at startup
+                                   and kept in sync with the file by register_user.
+        _auth_cache (OrderedDict): LRU set of recently verified (username, password digest)
+                                   pairs, used to skip the bcrypt check on repeated logins.
     """
 
-    def __init__(self, filename: str):
+    def __init__(self, filename: str, rounds: int = DEFAULT_BCRYPT_ROUNDS):
         """
         Initializes the UserDatabaseService with a specified filename and validates
         the user database.
 
         Args:
             filename (str): Path to the JSON file storing user data.
+            rounds (int): bcrypt cost factor used when hashing new passwords. Existing
+                          hashes keep the cost they were created with.
         """
         self.filename = filename
-        self._validate_database()
+        self.rounds = rounds
+        users = self._validate_database()
+        self._users: Dict[str, bytes] = {
+            user['username']: user['password'].encode('utf-8') for user in users
+        }
+        self._users_lock = threading.Lock()
+        self._auth_cache: OrderedDict = OrderedDict()
+        self._auth_cache_lock = threading.Lock()
 
     def _validate_database(self):
         """
         Validates the structure of the user database to ensure it is a JSON array of
         user dictionaries with the required keys ("username" and "password").
 
+        Returns:
+            list: The validated list of user dictionaries.
+
         Raises:
             ValueError: If the file does not exist, is not a valid JSON format, or
                         does not conform to the expected structure.
@@ -45,27 +78,19 @@ class UserDatabaseService:
         if not os.path.exists(self.filename):
             raise ValueError(f"Error: {self.filename} path doesn't exist.")
         try:
-            with open(self.filename, 'r', encoding='utf-8') as file:
-                users = json.load(file)
+            with open(self.filename, 'rb') as file:
+                data = file.read()
+            users = orjson.loads(data) if orjson else json.loads(data)
             if not isinstance(users, list):
                 raise ValueError(f"Error: {self.filename} is not a JSON array.")
             for user in users:
                 if not isinstance(user, dict) or \
                         set(user.keys()) != {"username", "password"}:
                     raise ValueError(f"Error: {self.filename} contains invalid user record")
+            return users
         except json.JSONDecodeError as exc:
             raise ValueError(f"Error: {self.filename} is not in a valid JSON format.") from exc
 
-    def _load_users(self):
-        """
-        Loads and returns the list of users from the JSON file.
-
-        Returns:
-            list: A list of user dictionaries from the database file.
-        """
-        with open(self.filename, 'r', encoding='utf-8') as file:
-            return json.load(file)
-
     def save_users(self, users):
         """
         Saves the provided list of users to the JSON file.
@@ -88,12 +113,18 @@ class UserDatabaseService:
             bool: True if the user was successfully registered, False if the username
                   already exists.
         """
-        users = self._load_users()
-        if any(user['username'] == username for user in users):
+        if self.user_exists(username):
             return False
-        hashed_pw = bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt())
-        users.append({'username': username, 'password': hashed_pw.decode('utf-8')})
-        self.save_users(users)
+        # Hash outside the lock so a slow bcrypt call doesn't hold up other registrations
+        hashed_pw = bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt(rounds=self.rounds))
+        with self._users_lock:
+            if username in self._users:
+                return False
+            self._users[username] = hashed_pw
+            self.save_users([
+                {'username': name, 'password': hashed.decode('utf-8')}
+                for name, hashed in self._users.items()
+            ])
         return True
 
     def user_exists(self, username: str) -> bool:
@@ -106,8 +137,7 @@ class UserDatabaseService:
         Returns:
             bool: True if the username exists, False otherwise.
         """
-        users = self._load_users()
-        return any(user['username'] == username for user in users)
+        return username in self._users
 
     def authenticate_user(self, username: str, password: str) -> bool:
         """
@@ -119,9 +149,21 @@ class UserDatabaseService:
 
         Returns:
             bool: True if the user credentials are correct, False otherwise.
+
+        Only successful checks are cached, keyed by a SHA-256 digest of the password so
+        the plaintext is never kept in memory.
         """
-        users = self._load_users()
-        user = next((user for user in users if user['username'] == username), None)
-        if user and bcrypt.checkpw(password.encode('utf-8'), user['password'].encode('utf-8')):
+        key = (username, hashlib.sha256(password.encode('utf-8')).digest())
+        with self._auth_cache_lock:
+            if key in self._auth_cache:
+                self._auth_cache.move_to_end(key)
+                return True
+
+        hashed_pw = self._users.get(username)
+        if hashed_pw is not None and bcrypt.checkpw(password.encode('utf-8'), hashed_pw):
+            with self._auth_cache_lock:
+                self._auth_cache[key] = True
+                if len(self._auth_cache) > AUTH_CACHE_SIZE:
+                    self._auth_cache.popitem(last=False)
             return True
         return False
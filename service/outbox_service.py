@@ -0,0 +1,227 @@
+"""
+Outbox Service Module
+
+This module provides the OutboxService class, which owns every write the server makes to
+its client sockets. Messages are sent straight away when the socket can take them; anything
+the kernel cannot accept immediately is queued per connection and written by a single
+background thread as soon as the socket becomes writable. A slow or stalled client therefore
+does not hold up the thread that produced the message (for example, a move broadcast to
+viewers). Where the platform has no MSG_DONTWAIT flag, a send is only attempted once select()
+reports the socket writable.
+
+Classes:
+    OutboxService: Queues and writes outgoing messages for client connections.
+"""
+
+import select
+import selectors
+import socket
+import threading
+import weakref
+from collections import deque
+from itertools import islice
+from typing import Dict
+
+# Unsent bytes a connection may accumulate before it is considered stalled and dropped
+MAX_PENDING_BYTES = 64 * 1024
+
+# Sends must never block while the outbox lock is held
+_HAS_DONTWAIT = hasattr(socket, "MSG_DONTWAIT")
+_SEND_FLAGS = socket.MSG_DONTWAIT if _HAS_DONTWAIT else 0
+
+# Most queued messages gathered into a single sendmsg call (kept well under IOV_MAX)
+_MAX_GATHER = 64
+
+# Platforms without sendmsg (e.g. Windows) fall back to one send per queued message
+_HAS_SENDMSG = hasattr(socket.socket, "sendmsg")
+
+
+def _writable(conn) -> bool:
+    """
+    Checks whether a send to a connection can be attempted without blocking. With
+    MSG_DONTWAIT every send is non-blocking, so this is only a real check without it.
+
+    Args:
+        conn (socket): The client connection socket.
+
+    Returns:
+        bool: True if the socket can take data now (or MSG_DONTWAIT is available).
+    """
+    if _HAS_DONTWAIT:
+        return True
+    try:
+        return bool(select.select((), (conn,), (), 0)[1])
+    except (ValueError, OSError):
+        # Closed socket; let the send itself fail and be handled as a broken connection
+        return True
+
+
+class OutboxService:
+    """
+    Queues outgoing messages per connection and writes them without blocking the caller.
+
+    Attributes:
+        max_pending_bytes (int): Unsent bytes allowed per connection before it is dropped.
+        _queues (Dict[socket, deque]): Messages (or message tails) still waiting to be sent,
+                                       only present for connections with pending data.
+        _pending (Dict[socket, int]): Number of unsent bytes per queued connection.
+        _closed (weakref.WeakSet): Connections discarded by their handler; anything sent
+                                   to them afterwards is dropped.
+    """
+
+    def __init__(self, max_pending_bytes: int = MAX_PENDING_BYTES):
+        """
+        Initializes the OutboxService and starts its background writer thread.
+
+        Args:
+            max_pending_bytes (int): Unsent bytes allowed per connection before it is dropped.
+        """
+        self.max_pending_bytes = max_pending_bytes
+        self._queues: Dict[socket.socket, deque] = {}
+        self._pending: Dict[socket.socket, int] = {}
+        self._closed = weakref.WeakSet()
+        self._lock = threading.Lock()
+        self._selector = selectors.DefaultSelector()
+
+        # Wakes the writer thread when a connection is newly registered for writing
+        self._wakeup_recv, self._wakeup_send = socket.socketpair()
+        self._wakeup_recv.setblocking(False)
+        self._wakeup_send.setblocking(False)
+        self._selector.register(self._wakeup_recv, selectors.EVENT_READ)
+
+        self._writer = threading.Thread(target=self._run, daemon=True)
+        self._writer.start()
+
+    def send(self, conn, payload: bytes) -> None:
+        """
+        Sends a message to a connection, queueing whatever cannot be written right away.
+        Messages to the same connection are always delivered in the order they were sent.
+
+        Args:
+            conn (socket): The client connection socket.
+            payload (bytes): The encoded message to send.
+
+        This method never raises for a closed or broken connection; such a connection
+        is detected and cleaned up by its own handler thread.
+        """
+        with self._lock:
+            if conn in self._closed:
+                return
+            queue = self._queues.get(conn)
+            if queue is not None:
+                queue.append(payload)
+                self._pending[conn] += len(payload)
+                if self._pending[conn] > self.max_pending_bytes:
+                    self._drop(conn)
+                return
+
+            try:
+                sent = conn.send(payload, _SEND_FLAGS) if _writable(conn) else 0
+            except BlockingIOError:
+                sent = 0
+            except OSError:
+                return
+            if sent == len(payload):
+                return
+
+            # The socket buffer is full; hand the remainder to the writer thread
+            try:
+                self._selector.register(conn, selectors.EVENT_WRITE)
+            except (ValueError, KeyError, OSError):
+                # Part of the message is already out; losing the rest would corrupt the
+                # stream, so disconnect the client instead
+                self._drop(conn)
+                return
+            self._queues[conn] = deque([memoryview(payload)[sent:]])
+            self._pending[conn] = len(payload) - sent
+        try:
+            self._wakeup_send.send(b"\0")
+        except BlockingIOError:
+            pass
+
+    def discard(self, conn) -> None:
+        """
+        Forgets any messages still queued for a connection and ignores anything sent to it
+        from then on. Must be called before the connection is closed.
+
+        Args:
+            conn (socket): The client connection socket.
+        """
+        with self._lock:
+            self._closed.add(conn)
+            self._forget(conn)
+
+    def _drop(self, conn) -> None:
+        """
+        Disconnects a connection whose unsent data exceeded the limit. Its handler thread
+        then sees the disconnect and cleans up as for any other client leaving.
+
+        Args:
+            conn (socket): The client connection socket.
+        """
+        self._forget(conn)
+        try:
+            conn.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+
+    def _forget(self, conn) -> None:
+        """
+        Removes a connection's queue and stops watching it for writability.
+
+        Args:
+            conn (socket): The client connection socket.
+        """
+        if self._queues.pop(conn, None) is None:
+            return
+        del self._pending[conn]
+        try:
+            self._selector.unregister(conn)
+        except (ValueError, KeyError):
+            pass
+
+    def _flush(self, conn) -> None:
+        """
+        Writes as much of a connection's queue as the socket accepts without blocking.
+        Queued messages are gathered into one sendmsg call rather than sent one by one.
+
+        Args:
+            conn (socket): The client connection socket.
+        """
+        with self._lock:
+            queue = self._queues.get(conn)
+            while queue:
+                try:
+                    if not _writable(conn):
+                        return
+                    if _HAS_SENDMSG:
+                        sent = conn.sendmsg(islice(queue, _MAX_GATHER), (), _SEND_FLAGS)
+                    else:
+                        sent = conn.send(queue[0], _SEND_FLAGS)
+                except BlockingIOError:
+                    return
+                except OSError:
+                    self._forget(conn)
+                    return
+                self._pending[conn] -= sent
+                while sent and sent >= len(queue[0]):
+                    sent -= len(queue.popleft())
+                if sent:
+                    queue[0] = memoryview(queue[0])[sent:]
+                    return
+            self._forget(conn)
+
+    def _run(self) -> None:
+        """
+        Writer thread loop: waits for queued connections to become writable and flushes them.
+        """
+        while True:
+            for key, _ in self._selector.select():
+                if key.fileobj is self._wakeup_recv:
+                    try:
+                        while self._wakeup_recv.recv(4096):
+                            pass
+                    except BlockingIOError:
+                        pass
+                else:
+                    self._flush(key.fileobj)